@@ -1,42 +1,42 @@
-from functools import wraps
-from collections import UserDict
-from datetime import date, datetime, timedelta
+import copy
+from bisect import bisect_left, insort
+from functools import lru_cache
+from datetime import date
 from typing import Callable, Any
 
 
 PHONE_LENGTH = 10
 DATE_FORMAT = "%d-%m-%Y"
-WEEKEND_DAYS = (5, 6)
+# Days to add per weekday (Monday is 0) to move weekends to Monday
+WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
 TABLE_LENGTH = 45
 COLUMN_LENGTH = 21
 
-
-def input_error(func: Callable) -> Callable:
-    """Decorator for handling user input errors."""
-
-    @wraps(func)
-    def inner(*args, **kwargs) -> str:
-        try:
-            return func(*args, **kwargs)
-        except ValueError as e:
-            # Handle validation and argument errors
-            return str(e)
-        except KeyError as e:
-            # Catches "Contact not found" errors
-            return e.args[0]
-        except IndexError:
-            # In case len(args) was missed somewhere
-            return "Enter user name."
-        except Exception as e:
-            # Any other unforeseen error
-            return f"An unexpected error occurred: {e}"
-
-    return inner
+# Table pieces shared by every rendering of the contact tables
+SEPARATOR = "-" * TABLE_LENGTH
+EMPTY_CELL = "".ljust(COLUMN_LENGTH)
+CONTACTS_HEADER = "\n".join(
+    (
+        SEPARATOR,
+        f"{'Name'.ljust(COLUMN_LENGTH)} | {'Phone'.ljust(COLUMN_LENGTH)}",
+        SEPARATOR,
+    )
+)
+BIRTHDAYS_HEADER = "\n".join(
+    (
+        SEPARATOR,
+        f"{'Name'.ljust(COLUMN_LENGTH)} | "
+        f"{'Congratulation Date'.ljust(COLUMN_LENGTH)}",
+        SEPARATOR,
+    )
+)
 
 
 class Field:
     """Base class for contact fields."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any) -> None:
         self.value = value
 
@@ -44,101 +44,317 @@ class Field:
         return str(self.value)
 
 
-class Name(Field):
-    """Contact name."""
-
-    pass
-
+def _validate_phone(value: str) -> None:
+    """Checks that the phone number has exactly 10 digits."""
+    # isascii() is a constant-time flag check; with isdigit() it
+    # accepts only the characters 0-9
+    if not (
+        len(value) == PHONE_LENGTH and value.isascii() and value.isdigit()
+    ):
+        raise ValueError("Phone number must be a 10-digit number.")
 
-class Phone(Field):
-    """Phone number with basic validation."""
 
-    def __init__(self, value: str) -> None:
-        if not value.isdigit() or len(value) != PHONE_LENGTH:
-            raise ValueError("Phone number must be a 10-digit number.")
-        super().__init__(value)
+@lru_cache(maxsize=4096)
+def _parse_birthday(value: str) -> date:
+    """
+    Parses a DD-MM-YYYY birthday. Results are cached, since dates are
+    immutable and the same birthday often repeats across contacts.
+    """
+    try:
+        # Manual DD-MM-YYYY parsing, much cheaper than strptime
+        day, month, year = value.split("-")
+        digits = day + month + year
+        if not (
+            0 < len(day) <= 2
+            and 0 < len(month) <= 2
+            and len(year) == 4
+            and digits.isascii()
+            and digits.isdecimal()
+        ):
+            raise ValueError
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        # Check if the error is due to format or invalid date
+        if "-" not in value:
+            raise ValueError(
+                f"Invalid date format. Use {DATE_FORMAT.replace('%', '')}."
+            )
+        raise ValueError(f"Invalid date: '{value}' does not exist.")
 
 
 class Birthday(Field):
     """Birthday field with date validation."""
 
-    def __init__(self, value: str) -> None:
-        try:
-            date_obj = datetime.strptime(value, DATE_FORMAT).date()
-        except ValueError:
-            # Check if the error is due to format or invalid date
-            if "-" not in value:
-                raise ValueError(
-                    f"Invalid date format. Use {DATE_FORMAT.replace('%', '')}."
-                )
-            raise ValueError(f"Invalid date: '{value}' does not exist.")
+    __slots__ = ("month", "day")
 
+    def __init__(self, value: str) -> None:
+        date_obj = _parse_birthday(value)
         super().__init__(date_obj)
+        self.month = date_obj.month
+        self.day = date_obj.day
+
+
+def _birthday_key(birthday: Birthday) -> int:
+    """Returns the month/day sort key of a birthday."""
+    return birthday.month * 100 + birthday.day
 
 
 class Record:
     """
     Represents a contact record with a name,
     list of phone numbers, and an optional birthday.
+
+    Name and phones are kept as plain validated strings. The name is
+    read-only, since address books index records by it.
     """
 
     def __init__(self, name: str) -> None:
-        self.name = Name(name)
-        self.phones: list[Phone] = []
-        self.birthday: Birthday | None = None
+        self._name = name
+        self.phones: list[str] = []
+        # Same phones as a set for constant-time lookups
+        self._phone_index: set[str] = set()
+        self._birthday: Birthday | None = None
+        # Address book the record belongs to, set by AddressBook.__setitem__
+        self._book: AddressBook | None = None
+
+    def __copy__(self) -> "Record":
+        # The copy gets its own phone containers and belongs to no book
+        record = Record(self._name)
+        record.phones = self.phones.copy()
+        record._phone_index = self._phone_index.copy()
+        record._birthday = self._birthday
+        return record
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickled and deep-copied records are detached from their book
+        state = self.__dict__.copy()
+        state["_book"] = None
+        return state
+
+    @property
+    def name(self) -> str:
+        return self._name
 
     def add_phone(self, phone: str) -> None:
-        if self.find_phone(phone):
+        if phone in self._phone_index:
             raise ValueError("Phone already exists")
-        self.phones.append(Phone(phone))
+        _validate_phone(phone)
+        self._phone_index.add(phone)
+        self.phones.append(phone)
 
     def remove_phone(self, phone: str) -> None:
-        phone_obj = self.find_phone(phone)
-        if phone_obj is None:
+        if phone not in self._phone_index:
             raise ValueError(f"Phone {phone} not found in this contact.")
-        self.phones.remove(phone_obj)
+        self._phone_index.remove(phone)
+        self.phones.remove(phone)
 
     def edit_phone(self, old_phone: str, new_phone: str) -> None:
-        phone_obj = self.find_phone(old_phone)
-        if phone_obj is None:
+        if old_phone not in self._phone_index:
             raise ValueError(f"Phone {old_phone} not found in this contact.")
+        if new_phone == old_phone:
+            return  # Stored phones are already valid, nothing to change
+        if new_phone in self._phone_index:
+            raise ValueError("Phone already exists")
+
+        _validate_phone(new_phone)  # Validate first to avoid partial update
+        self._replace_phone(old_phone, new_phone)
 
-        Phone(new_phone)  # Validate new phone first to avoid partial update
-        self.remove_phone(old_phone)
-        self.add_phone(new_phone)
+    def find_phone(self, phone: str) -> str | None:
+        return phone if phone in self._phone_index else None
 
-    def find_phone(self, phone: str) -> Phone | None:
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+    def _replace_phone(self, old_phone: str, new_phone: str) -> None:
+        """Swaps an existing phone for an already validated one in place."""
+        self._phone_index.remove(old_phone)
+        self._phone_index.add(new_phone)
+        self.phones[self.phones.index(old_phone)] = new_phone
+
+    @property
+    def birthday(self) -> Birthday | None:
+        return self._birthday
+
+    @birthday.setter
+    def birthday(self, birthday: Birthday | None) -> None:
+        previous = self._birthday
+        self._birthday = birthday
+        if self._book is not None:
+            if previous is not None:
+                self._book._unindex_birthday(self.name, previous)
+            if birthday is not None:
+                self._book._index_birthday(self.name, birthday)
 
     def add_birthday(self, birthday: str) -> None:
         self.birthday = Birthday(birthday)
 
 
-class AddressBook(UserDict):
-    """Container for contact records."""
+class AddressBook(dict):
+    """
+    Container for contact records.
+
+    Every write goes through __setitem__ and __delitem__ so the birthday
+    index and the records' back-references stay in sync. A record belongs
+    to one book at a time, so copies hold copies of the records.
+    """
+
+    __slots__ = ("_birthdays",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        # (month * 100 + day, name) for every record with a birthday,
+        # kept sorted so birthdays in a date range can be found by bisection
+        self._birthdays: list[tuple[int, str]] = []
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name: str, record: Record) -> None:
+        if record.name != name:
+            raise ValueError(
+                f"Record '{record.name}' cannot be stored as '{name}'."
+            )
+
+        if record._book is not None and record._book is not self:
+            raise ValueError(
+                f"Contact '{name}' already belongs to another address book."
+            )
+
+        replaced = self.get(name)
+        if replaced is not None:
+            self._detach(name, replaced)
+
+        super().__setitem__(name, record)
+        record._book = self
+
+        if record.birthday:
+            self._index_birthday(name, record.birthday)
+
+    def __delitem__(self, name: str) -> None:
+        record = self[name]
+        super().__delitem__(name)
+        self._detach(name, record)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so the birthday index is recreated
+        return self.__class__, (dict(self),)
+
+    def __copy__(self) -> "AddressBook":
+        return self.__class__(
+            {name: copy.copy(record) for name, record in self.items()}
+        )
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "AddressBook":
+        return self.__class__(copy.deepcopy(dict(self), memo))
+
+    def __or__(self, other: Any) -> "AddressBook":
+        book = self.copy()
+        book.update(other)
+        return book
+
+    def __ior__(self, other: Any) -> "AddressBook":
+        self.update(other)
+        return self
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name not in self:
+            return super().pop(name, *default)
+        record = self[name]
+        del self[name]
+        return record
+
+    def popitem(self) -> tuple[str, Record]:
+        name, record = super().popitem()
+        self._detach(name, record)
+        return name, record
+
+    def clear(self) -> None:
+        for record in self.values():
+            record._book = None
+        super().clear()
+        self._birthdays.clear()
+
+    def update(self, *args, **kwargs) -> None:
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def copy(self) -> "AddressBook":
+        return self.__copy__()
+
+    def setdefault(self, name: str, record: Record) -> Record:
+        if name not in self:
+            self[name] = record
+        return self[name]
 
     def add_record(self, record: Record) -> None:
-        self.data[record.name.value] = record
+        self[record.name] = record
 
     def find(self, name: str) -> Record | None:
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str) -> None:
-        if name not in self.data:
+        if name not in self:
             raise KeyError(f"Contact '{name}' not found.")
-        del self.data[name]
+        del self[name]
+
+    def birthdays_between(self, start: date, end: date) -> list[Record]:
+        """
+        Returns records whose birthday month and day fall between
+        start and end inclusive, wrapping over the new year.
+        """
+        start_key = start.month * 100 + start.day
+        end_key = end.month * 100 + end.day
+        birthdays = self._birthdays
+
+        low = bisect_left(birthdays, (start_key, ""))
+        high = bisect_left(birthdays, (end_key + 1, ""))
+        if start_key <= end_key:
+            entries = birthdays[low:high]
+        else:
+            entries = birthdays[low:] + birthdays[:high]
 
+        return [self[name] for _, name in entries]
 
-def parse_input(user_input: str) -> tuple[str, ...]:
+    def _index_birthday(self, name: str, birthday: Birthday) -> None:
+        insort(self._birthdays, (_birthday_key(birthday), name))
+
+    def _unindex_birthday(self, name: str, birthday: Birthday) -> None:
+        entry = (_birthday_key(birthday), name)
+        birthdays = self._birthdays
+        i = bisect_left(birthdays, entry)
+        if i < len(birthdays) and birthdays[i] == entry:
+            del birthdays[i]
+
+    def _detach(self, name: str, record: Record) -> None:
+        """Drops a record that is no longer stored from the index."""
+        record._book = None
+        if record.birthday:
+            self._unindex_birthday(name, record.birthday)
+
+
+def parse_input(user_input: str) -> tuple[str, list[str]]:
     """Parses the user input into a command and arguments."""
-    return tuple(user_input.strip().split())
+    parts = user_input.split(maxsplit=1)
+    if not parts:
+        return "", []
 
+    command = parts[0].lower()
+    args = parts[1].split() if len(parts) > 1 else []
+    return command, args
 
-@input_error
-def add_contact(args: tuple[str, ...], book: AddressBook) -> str:
+
+def _upsert_contact(book: AddressBook, name: str, phone: str) -> bool:
+    """
+    Adds a phone to the contact, creating the contact if needed.
+    Returns True if a new contact was created.
+    """
+    record = book.find(name)
+    if record is not None:
+        record.add_phone(phone)
+        return False
+
+    record = Record(name)
+    record.add_phone(phone)  # Validate phone before storing the record
+    book.add_record(record)
+    return True
+
+
+def add_contact(args: list[str], book: AddressBook) -> str:
     """
     Add either a new contact with a name and phone number,
     or a phone number to an existing contact.
@@ -149,21 +365,47 @@ def add_contact(args: tuple[str, ...], book: AddressBook) -> str:
         raise ValueError("Usage: add [name] [phone]")
 
     name, phone, *_ = args
-    record = book.find(name)
-    message = "Contact updated."
+    if _upsert_contact(book, name, phone):
+        return "Contact added."
+    return "Contact updated."
 
-    if record is None:
-        Phone(phone)  # Validate phone before creating record
-        record = Record(name)
-        book.add_record(record)
-        message = "Contact added."
 
-    record.add_phone(phone)
-    return message
+def bulk_add_contacts(args: list[str], book: AddressBook) -> str:
+    """
+    Adds several contacts at once, reporting a single summary.
+
+    Usage: bulk-add [name1],[phone1];[name2],[phone2];...
+    """
+    entries = [entry for entry in ";".join(args).split(";") if entry]
+    if not entries:
+        raise ValueError(
+            "Usage: bulk-add [name1],[phone1];[name2],[phone2];..."
+        )
+
+    created = updated = 0
+    failures: list[str] = []
+
+    for entry in entries:
+        name, sep, phone = entry.partition(",")
+        if not sep or not name or not phone:
+            failures.append(f"'{entry}': expected [name],[phone]")
+            continue
+
+        try:
+            if _upsert_contact(book, name, phone):
+                created += 1
+            else:
+                updated += 1
+        except ValueError as e:
+            failures.append(f"'{entry}': {e}")
+
+    summary = (
+        f"Created: {created}, updated: {updated}, failed: {len(failures)}."
+    )
+    return "\n".join([summary, *failures])
 
 
-@input_error
-def change_contact_phone(args: tuple[str, ...], book: AddressBook) -> str:
+def change_contact_phone(args: list[str], book: AddressBook) -> str:
     """
     Updates the phone number for an specified existing contact.
 
@@ -182,8 +424,7 @@ def change_contact_phone(args: tuple[str, ...], book: AddressBook) -> str:
     return "Contact phone number updated."
 
 
-@input_error
-def show_phone(args: tuple[str, ...], book: AddressBook) -> str:
+def show_phone(args: list[str], book: AddressBook) -> str:
     """
     Shows the phone number for a specific contact.
 
@@ -198,11 +439,10 @@ def show_phone(args: tuple[str, ...], book: AddressBook) -> str:
     if record is None:
         raise KeyError(f"Contact '{name}' not found.")
 
-    return f"Phones: {'; '.join(p.value for p in record.phones)}."
+    return f"Phones: {'; '.join(record.phones)}."
 
 
-@input_error
-def add_birthday(args: tuple[str, ...], book: AddressBook) -> str:
+def add_birthday(args: list[str], book: AddressBook) -> str:
     """
     Add a date of birth for the specified contact.
 
@@ -227,8 +467,7 @@ def add_birthday(args: tuple[str, ...], book: AddressBook) -> str:
     return message
 
 
-@input_error
-def show_birthday(args: tuple[str, ...], book: AddressBook) -> str:
+def show_birthday(args: list[str], book: AddressBook) -> str:
     """
     Display the date of birth for the specified contact.
 
@@ -246,45 +485,61 @@ def show_birthday(args: tuple[str, ...], book: AddressBook) -> str:
     return str(record.birthday) if record.birthday else "Birthday not set."
 
 
+def _is_leap(year: int) -> bool:
+    """Checks whether the year is a leap year."""
+    # For multiples of 4: divisible by 100 <=> by 25, by 400 <=> by 16
+    return year & 3 == 0 and (year % 25 != 0 or year & 15 == 0)
+
+
+def _birthday_ordinal(year: int, month: int, day: int, is_leap: bool) -> int:
+    """Returns the ordinal of a birthday in the given year."""
+    if day == 29 and month == 2 and not is_leap:
+        # Handle 29 February in non-leap year
+        day = 28
+    return date(year, month, day).toordinal()
+
+
 def get_upcoming_birthdays(book: AddressBook) -> list[dict[str, str]]:
     """
     Finds birthdays within 7 days and carries over congratulations from weeks
     """
     today = date.today()
+    today_ord = today.toordinal()
+    year = today.year
+    is_leap_this = _is_leap(year)
+    is_leap_next = _is_leap(year + 1)
     upcoming: list[dict[str, str]] = []
 
-    for record in book.data.values():
-        if not record.birthday:
-            continue
+    # One extra day so 29 February is still found when it is celebrated
+    # on 28 February of a non-leap year
+    candidates = book.birthdays_between(today, date.fromordinal(today_ord + 8))
 
-        try:
-            birthday_this_year = record.birthday.value.replace(year=today.year)
-        except ValueError:
-            # Handle 29 February in non-leap year
-            birthday_this_year = date(today.year, 2, 28)
+    for record in candidates:
+        month, day = record.birthday.month, record.birthday.day
+        birthday_ord = _birthday_ordinal(year, month, day, is_leap_this)
 
-        if birthday_this_year < today:
-            try:
-                birthday_this_year = birthday_this_year.replace(
-                    year=today.year + 1
-                )
-            except ValueError:
-                birthday_this_year = date(today.year + 1, 2, 28)
-
-        days_diff = (birthday_this_year - today).days
+        if birthday_ord < today_ord:
+            birthday_ord = _birthday_ordinal(
+                year + 1, month, day, is_leap_next
+            )
 
-        if 0 <= days_diff <= 7:
-            congratulation_date = birthday_this_year
+        days_diff = birthday_ord - today_ord
 
-            if congratulation_date.weekday() in WEEKEND_DAYS:
-                congratulation_date += timedelta(
-                    days=7 - congratulation_date.weekday()
-                )
+        if days_diff <= 7:
+            # Ordinal 1 (0001-01-01) is a Monday
+            weekday = (birthday_ord + 6) % 7
+            congratulation_date = date.fromordinal(
+                birthday_ord + WEEKEND_SHIFT[weekday]
+            )
 
             upcoming.append(
                 {
-                    "name": record.name.value,
-                    "date": congratulation_date.strftime(DATE_FORMAT),
+                    "name": record.name,
+                    "date": (
+                        f"{congratulation_date.day:02d}-"
+                        f"{congratulation_date.month:02d}-"
+                        f"{congratulation_date.year:04d}"
+                    ),
                 }
             )
 
@@ -300,20 +555,12 @@ def format_birthdays(upcoming: list[dict[str, str]]) -> str:
     if not upcoming:
         return "No upcoming birthdays in the next 7 days."
 
-    header = (
-        f"{'Name':<{COLUMN_LENGTH}} | {'Congratulation Date':<{COLUMN_LENGTH}}"
+    rows = (
+        f"{item['name'].ljust(COLUMN_LENGTH)} | "
+        f"{item['date'].ljust(COLUMN_LENGTH)}\n{SEPARATOR}"
+        for item in upcoming
     )
-    separator = "-" * TABLE_LENGTH
-
-    lines = [separator, header, separator]
-
-    for item in upcoming:
-        lines.append(
-            f"{item['name']:<{COLUMN_LENGTH}} | {item['date']:<{COLUMN_LENGTH}}"
-        )
-        lines.append(separator)
-
-    return "\n".join(lines)
+    return f"{BIRTHDAYS_HEADER}\n" + "\n".join(rows)
 
 
 def show_all(book: AddressBook) -> str:
@@ -322,31 +569,56 @@ def show_all(book: AddressBook) -> str:
 
     Usage: all
     """
-    if not book.data:
+    if not book:
         return "Address book is empty."
 
-    header = f"{'Name':<{COLUMN_LENGTH}} | {'Phone':<{COLUMN_LENGTH}}"
-    separator = "-" * TABLE_LENGTH
-
-    lines = [separator, header, separator]
+    records = book.values()
+    # Header, then for each record one line per phone (at least one)
+    # followed by a separator
+    lines: list[str] = [""] * (
+        1 + sum(max(len(record.phones), 1) + 1 for record in records)
+    )
+    lines[0] = CONTACTS_HEADER
+    i = 1
 
-    for record in book.data.values():
+    for record in records:
         phones = record.phones
-        first_phone = phones[0].value if phones else "No phones"
-        lines.append(
-            f"{record.name.value:<{COLUMN_LENGTH}} | {first_phone:<{COLUMN_LENGTH}}"
+        first_phone = phones[0] if phones else "No phones"
+        lines[i] = (
+            f"{record.name.ljust(COLUMN_LENGTH)} | "
+            f"{first_phone.ljust(COLUMN_LENGTH)}"
         )
+        i += 1
+
+        for phone in phones[1:]:
+            lines[i] = f"{EMPTY_CELL} | {phone.ljust(COLUMN_LENGTH)}"
+            i += 1
 
-        if len(phones) > 1:
-            for phone in phones[1:]:
-                lines.append(
-                    f'{"":<{COLUMN_LENGTH}} | {phone.value:<{COLUMN_LENGTH}}'
-                )
-        lines.append(separator)
+        lines[i] = SEPARATOR
+        i += 1
 
     return "\n".join(lines)
 
 
+# Commands that end the session
+EXIT_COMMANDS = frozenset(("close", "exit"))
+
+# Commands that take arguments, dispatched by name
+COMMAND_HANDLERS: dict[str, Callable[[list[str], AddressBook], str]] = {
+    "add": add_contact,
+    "bulk-add": bulk_add_contacts,
+    "change": change_contact_phone,
+    "phone": show_phone,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+}
+
+# Commands answered with a fixed reply
+STATIC_REPLIES: dict[str, str] = {
+    "hello": "How can I help you?",
+}
+
+
 def main() -> None:
     """Main loop for the assistant bot."""
     book = AddressBook()
@@ -361,26 +633,26 @@ def main() -> None:
             print("\nGood bye!")
             break
 
-        parts = parse_input(user_input)
-        command, args = parts[0].lower(), list(parts[1:])
+        command, args = parse_input(user_input)
 
-        if command in ("close", "exit"):
+        if command in EXIT_COMMANDS:
             print("Good bye!")
             break
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, book))
-        elif command == "change":
-            print(change_contact_phone(args, book))
-        elif command == "phone":
-            print(show_phone(args, book))
+
+        handler = COMMAND_HANDLERS.get(command)
+        if handler is not None:
+            try:
+                print(handler(args, book))
+            except ValueError as e:
+                # Handle validation and argument errors
+                print(e)
+            except KeyError as e:
+                # Catches "Contact not found" errors
+                print(e.args[0])
+        elif command in STATIC_REPLIES:
+            print(STATIC_REPLIES[command])
         elif command == "all":
             print(show_all(book))
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
         elif command == "birthdays":
             print(format_birthdays(get_upcoming_birthdays(book)))
         else:
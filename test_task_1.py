@@ -0,0 +1,163 @@
+import copy
+import pickle
+import unittest
+from datetime import date
+
+from task_1 import AddressBook, Birthday, Record, _birthday_key
+
+
+def make_record(name: str, birthday: str | None = None) -> Record:
+    record = Record(name)
+    record.add_phone("1234567890")
+    if birthday:
+        record.add_birthday(birthday)
+    return record
+
+
+class AddressBookCopyTest(unittest.TestCase):
+    """Copies of a book are independent books with their own records."""
+
+    def setUp(self) -> None:
+        self.book = AddressBook()
+        self.book.add_record(make_record("John", "01-01-2000"))
+        self.book.add_record(make_record("Jane"))
+
+    def assert_independent_copy(self, book_copy: AddressBook) -> None:
+        self.assertIsInstance(book_copy, AddressBook)
+        self.assertEqual(list(book_copy), ["John", "Jane"])
+        self.assertEqual(book_copy._birthdays, [(101, "John")])
+
+        for name, record in book_copy.items():
+            original = self.book[name]
+            self.assertIsNot(record, original)
+            self.assertIs(record._book, book_copy)
+            self.assertIs(original._book, self.book)
+            self.assertEqual(record.phones, original.phones)
+            self.assertIsNot(record.phones, original.phones)
+
+        # The original book is left untouched
+        self.assertEqual(list(self.book), ["John", "Jane"])
+        self.assertEqual(self.book._birthdays, [(101, "John")])
+
+    def test_copy(self) -> None:
+        self.assert_independent_copy(copy.copy(self.book))
+
+    def test_copy_method(self) -> None:
+        self.assert_independent_copy(self.book.copy())
+
+    def test_union(self) -> None:
+        self.assert_independent_copy(self.book | {})
+
+    def test_deepcopy(self) -> None:
+        self.assert_independent_copy(copy.deepcopy(self.book))
+
+    def test_pickle(self) -> None:
+        self.assert_independent_copy(pickle.loads(pickle.dumps(self.book)))
+
+    def test_copy_tracks_its_own_birthdays(self) -> None:
+        book_copy = copy.copy(self.book)
+        book_copy["Jane"].add_birthday("02-01-2000")
+
+        self.assertEqual(book_copy._birthdays, [(101, "John"), (102, "Jane")])
+        self.assertEqual(self.book._birthdays, [(101, "John")])
+
+
+class BirthdayIndexTest(unittest.TestCase):
+    """The sorted birthday index follows every change to the book."""
+
+    def setUp(self) -> None:
+        self.book = AddressBook(
+            {"John": make_record("John", "05-03-1990")},
+            Jane=make_record("Jane", "01-12-1985"),
+        )
+        self.book.add_record(make_record("Bob"))
+
+    def assert_index_in_sync(self) -> None:
+        expected = sorted(
+            (_birthday_key(record.birthday), name)
+            for name, record in self.book.items()
+            if record.birthday
+        )
+        self.assertEqual(self.book._birthdays, expected)
+
+    def test_constructor(self) -> None:
+        self.assert_index_in_sync()
+
+    def test_setitem(self) -> None:
+        self.book["Ann"] = make_record("Ann", "10-10-2000")
+        self.assert_index_in_sync()
+        self.book["John"] = make_record("John", "07-07-1990")
+        self.assert_index_in_sync()
+
+    def test_delitem(self) -> None:
+        del self.book["John"]
+        self.assert_index_in_sync()
+
+    def test_delete(self) -> None:
+        self.book.delete("Jane")
+        self.assert_index_in_sync()
+
+    def test_pop(self) -> None:
+        record = self.book.pop("John")
+        self.assertIsNone(record._book)
+        self.assertIsNone(self.book.pop("Nobody", None))
+        self.assert_index_in_sync()
+
+    def test_popitem(self) -> None:
+        _, record = self.book.popitem()
+        self.assertIsNone(record._book)
+        self.assert_index_in_sync()
+
+    def test_clear(self) -> None:
+        self.book.clear()
+        self.assertEqual(self.book._birthdays, [])
+
+    def test_update(self) -> None:
+        self.book.update({"Ann": make_record("Ann", "10-10-2000")})
+        self.assert_index_in_sync()
+
+    def test_ior(self) -> None:
+        self.book |= {"Ann": make_record("Ann", "10-10-2000")}
+        self.assert_index_in_sync()
+
+    def test_setdefault(self) -> None:
+        self.book.setdefault("Ann", make_record("Ann", "10-10-2000"))
+        self.book.setdefault("John", make_record("John", "07-07-1990"))
+        self.assert_index_in_sync()
+        self.assertEqual(self.book["John"].birthday.month, 3)
+
+    def test_add_birthday(self) -> None:
+        self.book["Bob"].add_birthday("02-02-2002")
+        self.book["John"].add_birthday("06-06-1990")
+        self.assert_index_in_sync()
+
+    def test_birthday_assignment(self) -> None:
+        self.book["Bob"].birthday = Birthday("02-02-2002")
+        self.book["John"].birthday = None
+        self.assert_index_in_sync()
+
+    def test_birthdays_between_wraps_new_year(self) -> None:
+        self.book["Bob"].add_birthday("02-01-2002")
+        records = self.book.birthdays_between(
+            date(2024, 11, 30), date(2025, 1, 3)
+        )
+        self.assertEqual([record.name for record in records], ["Jane", "Bob"])
+
+    def test_record_in_another_book_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            AddressBook().add_record(self.book["John"])
+        self.assert_index_in_sync()
+
+
+class BirthdayParsingTest(unittest.TestCase):
+    def test_accepts_ascii_digits(self) -> None:
+        self.assertEqual(Birthday("1-2-2000").value, date(2000, 2, 1))
+        self.assertEqual(Birthday("01-02-2000").value, date(2000, 2, 1))
+
+    def test_rejects_non_ascii_digits(self) -> None:
+        with self.assertRaises(ValueError):
+            Birthday("\u0661-01-2000")
+
+
+if __name__ == "__main__":
+    unittest.main()